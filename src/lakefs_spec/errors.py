@@ -18,6 +18,7 @@ HTTP_CODE_TO_ERROR: dict[int, type[OSError] | partial[OSError]] = {
     410: FileNotFoundError,  # Gone (temporarily / permanently unavailable)
     416: partial(IOError, errno.EINVAL),  # invalid range
     420: partial(IOError, errno.EBUSY),  # too many requests
+    429: partial(IOError, errno.EBUSY),  # too many requests (standard status code)
 }
 
 
@@ -8,7 +8,8 @@ import errno
 import logging
 import operator
 import os
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import cached_property
 from pathlib import Path
@@ -23,6 +24,7 @@ from lakefs.client import Client
 from lakefs.exceptions import NotFoundException, ServerException
 from lakefs.models import CommonPrefix, ObjectInfo
 from lakefs.object import LakeFSIOBase, ObjectReader, ObjectWriter
+from urllib3.util.retry import Retry
 
 from lakefs_spec.errors import translate_lakefs_error
 from lakefs_spec.transaction import LakeFSTransaction
@@ -32,6 +34,18 @@ logger = logging.getLogger("lakefs-spec")
 
 MAX_DELETE_OBJS = 1000
 
+# Retry policy for transient server errors, like rate limiting or a temporarily unavailable server.
+# Only idempotent requests are retried (the urllib3 default), with exponential backoff between
+# attempts. After the last attempt, the error response is passed on to the lakeFS SDK as usual.
+# `Retry-After` headers are ignored, since a large value would block a file system call for as long.
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 502, 503, 504),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+
 
 class LakeFSFileSystem(AbstractFileSystem):
     """
@@ -110,10 +124,25 @@ class LakeFSFileSystem(AbstractFileSystem):
         self.client.config.proxy = proxy
         # whether to verify SSL certs, not part of the constructor
         self.client.config.verify_ssl = verify_ssl
+        # retry policy for transient errors, not part of the constructor. The SDK reads its `retries`
+        # setting only when the client constructor creates the connection pool manager, so the
+        # policy goes to the (still empty) pool manager of the client created above instead.
+        self._install_retry_policy()
 
         self.create_branch_ok = create_branch_ok
         self.source_branch = source_branch
 
+    def _install_retry_policy(self) -> None:
+        try:
+            pool_manager = self.client.sdk_client._api.rest_client.pool_manager
+        except AttributeError:
+            logger.warning(
+                "Could not install the retry policy on the lakeFS SDK's connection pool manager, "
+                "transient server errors will not be retried."
+            )
+            return
+        pool_manager.connection_pool_kw["retries"] = RETRY_POLICY
+
     @cached_property
     def _lakefs_server_version(self):
         with self.wrapped_api_call():
@@ -132,8 +161,9 @@ class LakeFSFileSystem(AbstractFileSystem):
         """Copied verbatim from the base class, save for the slash rstrip."""
         if isinstance(path, list):
             return [cls._strip_protocol(p) for p in path]
+        path = stringify_path(path)
         spath = super()._strip_protocol(path)
-        if stringify_path(path).endswith("/"):
+        if path.endswith("/"):
             return spath + "/"
         return spath
 
@@ -231,7 +261,7 @@ class LakeFSFileSystem(AbstractFileSystem):
                 return True
             # if it isn't an object, it might be a common prefix (i.e. "directory").
             children = reference.objects(
-                max_amount=1, prefix=resource.rstrip("/") + "/", delimiter="/"
+                max_amount=1, amount=1, prefix=resource.rstrip("/") + "/", delimiter="/"
             )
             return len(list(children)) > 0
         except NotFoundException:
@@ -241,6 +271,42 @@ class LakeFSFileSystem(AbstractFileSystem):
             # decided, so raise the translated error.
             raise translate_lakefs_error(e)
 
+    def exists_bulk(
+        self, paths: Iterable[str | os.PathLike[str]], max_workers: int = 8
+    ) -> dict[str, bool]:
+        """
+        Check existence of multiple remote paths in lakeFS.
+
+        Since lakeFS has no batch API for existence checks, the individual checks
+        are issued concurrently from a thread pool instead of one after another.
+
+        Parameters
+        ----------
+        paths: Iterable[str | os.PathLike[str]]
+            The remote paths whose existence to check. Must be fully qualified lakeFS URIs.
+            Duplicate paths are checked only once.
+        max_workers: int
+            Maximum number of existence checks to run concurrently.
+
+        Returns
+        -------
+        dict[str, bool]
+            A mapping of each (stringified) input path to the result of ``exists()`` on it.
+
+        Raises
+        ------
+        ValueError
+            If ``max_workers`` is not positive.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        unique_paths = list(dict.fromkeys(stringify_path(p) for p in paths))
+        if not unique_paths:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(len(unique_paths), max_workers)) as pool:
+            return dict(zip(unique_paths, pool.map(self.exists, unique_paths)))
+
     def cp_file(
         self, path1: str | os.PathLike[str], path2: str | os.PathLike[str], **kwargs: Any
     ) -> None:
@@ -711,7 +777,10 @@ class LakeFSFileSystem(AbstractFileSystem):
         self.rm(path)
 
     def rm(
-        self, path: str | os.PathLike[str], recursive: bool = False, maxdepth: int | None = None
+        self,
+        path: str | os.PathLike[str] | list[str | os.PathLike[str]],
+        recursive: bool = False,
+        maxdepth: int | None = None,
     ) -> None:
         """
         Stage multiple remote files for removal on a lakeFS server.
@@ -720,8 +789,10 @@ class LakeFSFileSystem(AbstractFileSystem):
 
         Parameters
         ----------
-        path: str | os.PathLike[str]
-            File(s) to delete.
+        path: str | os.PathLike[str] | list[str | os.PathLike[str]]
+            File(s) to delete. Objects on the same branch are removed in batched
+            ``delete_objects`` calls, regardless of the path they were found under.
+            Objects matched by several (overlapping) paths are deleted only once.
         recursive: bool
             If file(s) include nested directories, recursively delete their contents.
         maxdepth: int | None
@@ -730,26 +801,46 @@ class LakeFSFileSystem(AbstractFileSystem):
             possible.
         """
 
-        path = stringify_path(path)
-        repository, ref, prefix = parse(path)
+        if isinstance(path, (str, os.PathLike)):
+            path = [path]
+        paths = [stringify_path(p) for p in path]
 
-        with self.wrapped_api_call(rpath=path):
-            branch = lakefs.Branch(repository, ref, client=self.client)
-            objgen_batched = batched(
-                branch.objects(prefix=prefix, delimiter="" if recursive else "/"), n=MAX_DELETE_OBJS
-            )
-            if maxdepth is None:
-                for objgen in objgen_batched:
-                    branch.delete_objects(obj.path for obj in objgen)
-            else:
-                for objgen in objgen_batched:
-                    # nesting level is just the amount of "/"s in the path, no leading "/".
-                    branch.delete_objects(
-                        obj.path for obj in objgen if obj.path.count("/") <= maxdepth
-                    )
+        # group the paths by branch, to batch the deletions across all of its prefixes.
+        paths_by_branch: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        for p in paths:
+            repository, ref, prefix = parse(p)
+            paths_by_branch.setdefault((repository, ref), []).append((p, prefix))
+
+        delimiter = "" if recursive else "/"
 
-            # Directory listing cache for the containing folder must be invalidated
-            self.dircache.pop(self._parent(path), None)
+        def find_objects(
+            branch: lakefs.Branch, branch_paths: list[tuple[str, str]]
+        ) -> Generator[tuple[str, str], None, None]:
+            # yields (requested path, object path), each object only once for overlapping paths.
+            # a single path cannot overlap with itself, so its objects are streamed without tracking.
+            seen: set[str] | None = set() if len(branch_paths) > 1 else None
+            for rpath, prefix in branch_paths:
+                with self.wrapped_api_call(rpath=rpath):
+                    for obj in branch.objects(prefix=prefix, delimiter=delimiter):
+                        # nesting level is just the amount of "/"s in the path, no leading "/".
+                        if maxdepth is not None and obj.path.count("/") > maxdepth:
+                            continue
+                        if seen is not None:
+                            if obj.path in seen:
+                                continue
+                            seen.add(obj.path)
+                        yield rpath, obj.path
+
+        for (repository, ref), branch_paths in paths_by_branch.items():
+            branch = lakefs.Branch(repository, ref, client=self.client)
+            for batch in batched(find_objects(branch, branch_paths), n=MAX_DELETE_OBJS):
+                # report errors for the path the first object of the batch was found under.
+                with self.wrapped_api_call(rpath=batch[0][0]):
+                    branch.delete_objects(objpath for _, objpath in batch)
+
+        # Directory listing cache for the containing folders must be invalidated
+        for p in paths:
+            self.dircache.pop(self._parent(p), None)
 
     def touch(self, path: str | os.PathLike[str], truncate: bool = True, **kwargs: Any) -> None:
         """
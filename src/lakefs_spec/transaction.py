@@ -7,13 +7,15 @@ import random
 import string
 import warnings
 from collections import deque
-from typing import TYPE_CHECKING, Literal, TypeVar
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 import lakefs
 from fsspec.transaction import Transaction
 from lakefs.branch import Branch, Reference
 from lakefs.client import Client
 from lakefs.exceptions import ServerException
+from lakefs.models import Change
 from lakefs.object import ObjectWriter
 from lakefs.reference import Commit, ReferenceType
 from lakefs.repository import Repository
@@ -27,6 +29,12 @@ if TYPE_CHECKING:  # pragma: no cover
     from lakefs_spec import LakeFSFileSystem
 
 
+def _has_changes(listing: Callable[..., Iterator[Change]], *args: Any) -> bool:
+    # a single change is enough to decide, so request a page size of one
+    # instead of having the server return (and us parse) a full page of changes.
+    return any(listing(*args, max_amount=1, amount=1))
+
+
 def _ensurebranch(b: str | Branch, repository: str, client: Client) -> Branch:
     if isinstance(b, str):
         return Branch(repository, b, client=client)
@@ -133,14 +141,14 @@ class LakeFSTransaction(Transaction):
         self.fs._intrans = False
         self.fs._transaction = None
 
-        if any(self._ephemeral_branch.uncommitted()):
+        if _has_changes(self._ephemeral_branch.uncommitted):
             msg = f"Finished transaction on branch {self._ephemeral_branch.id!r} with uncommitted changes."
             if self.delete != "never":
                 msg += " Objects added but not committed are lost."
             warnings.warn(msg)
 
         if success and self.automerge:
-            if any(self.base_branch.diff(self._ephemeral_branch)):
+            if _has_changes(self.base_branch.diff, self._ephemeral_branch):
                 self._ephemeral_branch.merge_into(self.base_branch, squash_merge=self.squash)
         if self.delete == "always" or (success and self.delete == "onsuccess"):
             self._ephemeral_branch.delete()
@@ -167,9 +175,7 @@ class LakeFSTransaction(Transaction):
             The created commit.
         """
 
-        diff = list(self.branch.uncommitted())
-
-        if not diff:
+        if not _has_changes(self.branch.uncommitted):
             logger.warning(f"No changes to commit on branch {self.branch.id!r}.")
             return self.branch.head
 
@@ -200,7 +206,7 @@ class LakeFSTransaction(Transaction):
         source = _ensurebranch(source_ref, self.repository, self.fs.client)
         dest = _ensurebranch(into, self.repository, self.fs.client)
 
-        if any(dest.diff(source)):
+        if _has_changes(dest.diff, source):
             source.merge_into(dest, squash_merge=squash)
         return dest.head.get_commit()
 
@@ -88,12 +88,14 @@ def md5_checksum(lpath: str | os.PathLike[str], blocksize: int = 2**22) -> str:
     str
         The file's MD5 hash value, as a string.
     """
-    with open(lpath, "rb") as f:
-        file_hash = hashlib.md5(usedforsecurity=False)
-        chunk = f.read(blocksize)
-        while chunk:
-            file_hash.update(chunk)
-            chunk = f.read(blocksize)
+    file_hash = hashlib.md5(usedforsecurity=False)
+    # read into a single reusable buffer instead of allocating a new bytes object per block,
+    # and skip Python's own buffering, since we already read in large blocks.
+    buf = bytearray(blocksize)
+    view = memoryview(buf)
+    with open(lpath, "rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            file_hash.update(view[:n])
     return file_hash.hexdigest()
 
 
@@ -1,7 +1,6 @@
 import contextlib
 import logging
-import random
-import string
+import os
 import sys
 from collections.abc import Generator
 from pathlib import Path
@@ -15,7 +14,7 @@ from lakefs.client import Client
 from lakefs.repository import Repository
 
 from lakefs_spec import LakeFSFileSystem
-from tests.util import RandomFileFactory
+from tests.util import APICounter, RandomFileFactory, temp_branch_name, with_counter
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -41,8 +40,9 @@ def pytest_report_header(config):
     ]
 
 
-@pytest.fixture
-def fs() -> LakeFSFileSystem:
+@pytest.fixture(scope="session")
+def _fs() -> LakeFSFileSystem:
+    """A lakeFS file system shared across the session, so that its client is only set up once."""
     LakeFSFileSystem.clear_instance_cache()
     return LakeFSFileSystem(
         host="localhost:8000",
@@ -51,6 +51,27 @@ def fs() -> LakeFSFileSystem:
     )
 
 
+@pytest.fixture
+def fs(_fs: LakeFSFileSystem) -> YieldFixture[LakeFSFileSystem]:
+    """The shared lakeFS file system, with a clean listings cache and per-test changes undone."""
+    # tests tweak attributes (e.g. `create_branch_ok`), so snapshot the instance dict
+    # and restore it afterwards.
+    fs_state = vars(_fs).copy()
+    _fs.dircache.clear()
+    try:
+        yield _fs
+    finally:
+        vars(_fs).clear()
+        vars(_fs).update(fs_state)
+
+
+@pytest.fixture
+def counter(fs: LakeFSFileSystem) -> YieldFixture[APICounter]:
+    """Counts the lakeFS API calls made by the ``fs`` fixture during the test."""
+    with with_counter(fs.client) as counter:
+        yield counter
+
+
 @pytest.fixture(scope="session")
 def _client() -> Client:
     """A lakeFS client for API operations outside of the file system."""
@@ -64,6 +85,10 @@ def _client() -> Client:
 @pytest.fixture(scope="session")
 def repository(_client: Client) -> Repository:
     name = "lakefs-spec-tests"
+    # give each pytest-xdist worker its own repository, so that tests running
+    # in parallel cannot interfere with each other through shared refs or tags.
+    if worker := os.getenv("PYTEST_XDIST_WORKER"):
+        name += f"-{worker}"
     storage_namespace = f"{_client.storage_config.default_namespace_prefix}/{name}"
     repo = lakefs.Repository(name, client=_client).create(
         storage_namespace=storage_namespace, include_samples=True, exist_ok=True
@@ -71,7 +96,19 @@ def repository(_client: Client) -> Repository:
     return repo
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def main_head(repository: Repository) -> str:
+    """The commit ID of the main branch head, which is fixed since tests never write to main."""
+    return repository.branch("main").head.id
+
+
+@pytest.fixture(scope="session")
+def main_listing(_fs: LakeFSFileSystem, repository: Repository) -> list[dict[str, Any]]:
+    """The listing of the main branch root (with the default page size), fetched once per session."""
+    return _fs.ls(f"{repository.id}/main/", refresh=True)
+
+
+@pytest.fixture(scope="session")
 def temporary_branch_context(repository: Repository) -> Any:
     @contextlib.contextmanager
     def _wrapper(name: str) -> YieldFixture[str]:
@@ -87,14 +124,27 @@ def temporary_branch_context(repository: Repository) -> Any:
 @pytest.fixture
 def temp_branch(repository: str, temporary_branch_context: Any) -> YieldFixture[str]:
     """Create a temporary branch for a test."""
-    name = "test-" + "".join(random.choices(string.digits, k=8))
-    with temporary_branch_context(name) as tb:
+    with temporary_branch_context(temp_branch_name()) as tb:
         yield tb
 
 
-@pytest.fixture
-def random_file_factory(tmp_path: Path) -> RandomFileFactory:
-    return RandomFileFactory(path=tmp_path)
+@pytest.fixture(scope="module")
+def module_temp_branch(repository: str, temporary_branch_context: Any) -> YieldFixture[str]:
+    """Create a temporary branch shared by all tests in a module."""
+    with temporary_branch_context(temp_branch_name()) as tb:
+        yield tb
+
+
+@pytest.fixture(scope="session")
+def random_file_factory(tmp_path_factory: pytest.TempPathFactory) -> RandomFileFactory:
+    # file names are uuid-based, so all tests can share one directory.
+    return RandomFileFactory(path=tmp_path_factory.mktemp("random_files"))
+
+
+@pytest.fixture(scope="session")
+def random_file(random_file_factory: RandomFileFactory) -> Path:
+    """A random file for tests that need some file to upload, but do not care about its contents."""
+    return random_file_factory.make()
 
 
 @pytest.fixture
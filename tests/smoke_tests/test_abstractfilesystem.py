@@ -6,7 +6,6 @@ from lakefs.branch import Branch
 from lakefs.repository import Repository
 
 from lakefs_spec.spec import LakeFSFileSystem
-from tests.util import RandomFileFactory
 
 
 def test_walk_single_dir(fs: LakeFSFileSystem, repository: Repository) -> None:
@@ -176,17 +175,16 @@ def test_head_tail(
 
 
 def test_mv(
-    random_file_factory: RandomFileFactory,
+    random_file: Path,
     fs: LakeFSFileSystem,
     repository: Repository,
     temp_branch: Branch,
 ) -> None:
-    random_file = random_file_factory.make()
     lpath = str(random_file)
     rpath1 = f"{repository.id}/{temp_branch.id}/new_dir/{random_file.name}"
     rpath2 = f"{repository.id}/{temp_branch.id}/{random_file.name}"
 
-    fs.put_file(lpath=lpath, rpath=rpath1)
+    fs.put_file(lpath=lpath, rpath=rpath1, precheck=False)
     assert fs.exists(rpath1)
     assert not fs.exists(rpath2)
 
@@ -196,17 +194,16 @@ def test_mv(
 
 
 def test_copy(
-    random_file_factory: RandomFileFactory,
+    random_file: Path,
     fs: LakeFSFileSystem,
     repository: Repository,
     temp_branch: Branch,
 ) -> None:
-    random_file = random_file_factory.make()
     lpath = str(random_file)
     rpath1 = f"{repository.id}/{temp_branch.id}/new_dir/{random_file.name}"
     rpath2 = f"{repository.id}/{temp_branch.id}/{random_file.name}"
 
-    fs.put_file(lpath=lpath, rpath=rpath1)
+    fs.put_file(lpath=lpath, rpath=rpath1, precheck=False)
     assert fs.exists(rpath1)
     assert not fs.exists(rpath2)
 
@@ -218,16 +215,15 @@ def test_copy(
 
 
 def test_get_file(
-    random_file_factory: RandomFileFactory,
+    random_file: Path,
     fs: LakeFSFileSystem,
     repository: Repository,
     temp_branch: Branch,
     tmp_path: Path,
 ) -> None:
-    random_file = random_file_factory.make()
     lpath1 = str(random_file)
     rpath = f"{repository.id}/{temp_branch.id}/{random_file.name}"
-    fs.put(lpath=lpath1, rpath=rpath)
+    fs.put(lpath=lpath1, rpath=rpath, precheck=False)
 
     lpath2 = str(tmp_path / random_file.name)
     fs.get(rpath=rpath, lpath=lpath2)
@@ -1,23 +1,21 @@
 import time
+from pathlib import Path
 
 from lakefs.branch import Branch
 from lakefs.repository import Repository
 
 from lakefs_spec import LakeFSFileSystem
 from lakefs_spec.spec import md5_checksum
-from tests.util import RandomFileFactory, with_counter
+from tests.util import APICounter
 
 
 def test_checksum_matching(
-    random_file_factory: RandomFileFactory,
+    random_file: Path,
     fs: LakeFSFileSystem,
     repository: Repository,
     temp_branch: Branch,
+    counter: APICounter,
 ) -> None:
-    random_file = random_file_factory.make()
-
-    fs.client, counter = with_counter(fs.client)
-
     lpath = str(random_file)
     rpath = f"{repository.id}/{temp_branch.id}/{random_file.name}"
     fs.put_file(lpath, rpath)
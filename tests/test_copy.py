@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -5,23 +6,20 @@ from lakefs.branch import Branch
 from lakefs.repository import Repository
 
 from lakefs_spec import LakeFSFileSystem
-from tests.util import RandomFileFactory, with_counter
+from tests.util import APICounter
 
 
 def test_copy(
-    random_file_factory: RandomFileFactory,
+    random_file: Path,
     fs: LakeFSFileSystem,
     repository: Repository,
     temp_branch: Branch,
     temporary_branch_context: Any,
 ) -> None:
-    random_file = random_file_factory.make()
-
     lpath = str(random_file)
     rpath = f"{repository.id}/{temp_branch.id}/{random_file.name}"
 
-    fs.put(lpath, rpath)
-    assert fs.exists(rpath)
+    fs.put(lpath, rpath, precheck=False)
 
     with temporary_branch_context("new-copy-test") as b:
         new_rpath = f"{repository.id}/{b.id}/{random_file.name}"
@@ -33,9 +31,8 @@ def test_copy_edge_cases(
     fs: LakeFSFileSystem,
     repository: Repository,
     temp_branch: Branch,
+    counter: APICounter,
 ) -> None:
-    fs.client, counter = with_counter(fs.client)
-
     path = f"{repository.id}/main/lakes.parquet"
 
     fs.cp_file(path, path)
@@ -1,34 +1,40 @@
+import errno
 import json
 
 from lakefs.exceptions import ServerException
 
 from lakefs_spec.errors import translate_lakefs_error
 
+# JSON response bodies of the simulated lakeFS API errors.
+UNAUTHORIZED_BODY = json.dumps({"message": "unauthorized"})
+TOO_MANY_REQUESTS_BODY = json.dumps({"message": "too many requests"})
+BAD_REQUEST_BODY = json.dumps({"message": "bad request"})
+
 
 def test_error_translation() -> None:
     rpath = "repo/ref/ohno.txt"
 
     # first case: lakeFS API error, 401 unauthorized
-    e = ServerException(
-        status=401, reason="unauthorized", body=json.dumps({"message": "unauthorized"})
-    )
+    e = ServerException(status=401, reason="unauthorized", body=UNAUTHORIZED_BODY)
 
     translated_err = translate_lakefs_error(e, rpath=rpath)
     assert isinstance(translated_err, PermissionError)
     assert f"unauthorized: {rpath!r}" in str(translated_err)
 
     # second case: lakeFS API error 420 (corresponds to partial IOError)
-    e = ServerException(
-        status=420, reason="too many requests", body=json.dumps({"message": "too many requests"})
-    )
+    e = ServerException(status=420, reason="too many requests", body=TOO_MANY_REQUESTS_BODY)
     translated_err = translate_lakefs_error(e, rpath=rpath)
     assert isinstance(translated_err, OSError)
     assert f"too many requests: {rpath!r}" in str(translated_err)
 
+    # same for the standard "too many requests" status code 429.
+    e = ServerException(status=429, reason="too many requests", body=TOO_MANY_REQUESTS_BODY)
+    translated_err = translate_lakefs_error(e, rpath=rpath)
+    assert isinstance(translated_err, OSError)
+    assert translated_err.errno == errno.EBUSY
+
     # third case: lakeFS API error 400 with a custom message.
-    e = ServerException(
-        status=400, reason="bad request", body=json.dumps({"message": "bad request"})
-    )
+    e = ServerException(status=400, reason="bad request", body=BAD_REQUEST_BODY)
     message = "oh no!"
     translated_err = translate_lakefs_error(e, message=message)
     assert isinstance(translated_err, OSError)
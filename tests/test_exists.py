@@ -1,9 +1,10 @@
-import lakefs
+from pathlib import Path
+
+import pytest
 from lakefs.branch import Branch
 from lakefs.repository import Repository
 
 from lakefs_spec import LakeFSFileSystem
-from tests.util import RandomFileFactory
 
 
 def test_exists(fs: LakeFSFileSystem, repository: Repository) -> None:
@@ -16,45 +17,70 @@ def test_exists(fs: LakeFSFileSystem, repository: Repository) -> None:
     assert not fs.exists(nonexistent_file)
 
 
-def test_exists_on_commit(fs: LakeFSFileSystem, repository: Repository) -> None:
+def test_exists_on_commit(fs: LakeFSFileSystem, repository: Repository, main_head: str) -> None:
     """Test `fs.exists` works on commit SHAs to query existence of files in revisions."""
     example_file = f"{repository.id}/main/README.md"
     assert fs.exists(example_file)
-    head = lakefs.Branch(repository.id, "main", client=fs.client).head
-    assert fs.exists(f"{repository.id}/{head.id}/README.md")
+    assert fs.exists(f"{repository.id}/{main_head}/README.md")
 
 
 def test_exists_on_staged_file(
-    random_file_factory: RandomFileFactory,
+    random_file: Path,
     fs: LakeFSFileSystem,
     repository: Repository,
     temp_branch: Branch,
 ) -> None:
-    random_file = random_file_factory.make()
-
     lpath = str(random_file)
     rpath = f"{repository.id}/{temp_branch.id}/{random_file.name}"
 
     # upload, verify existence.
-    fs.put(lpath, rpath)
+    fs.put(lpath, rpath, precheck=False)
     assert fs.exists(rpath)
 
 
 def test_exists_repo_root(
     fs: LakeFSFileSystem,
     repository: Repository,
+    main_head: str,
 ) -> None:
     """Test `fs.exists` on the repository root."""
 
+    # check all roots at once, the existence checks are independent of each other.
+    results = fs.exists_bulk(
+        [
+            f"lakefs://{repository.id}/main/",
+            f"lakefs://{repository.id}/{main_head}/",
+            f"lakefs://{repository.id}/nonexistent/",
+            "lakefs://nonexistent/main/",
+        ]
+    )
+
     # Existing repo and branch should return true
-    assert fs.exists(f"lakefs://{repository.id}/main/")
+    assert results[f"lakefs://{repository.id}/main/"]
 
     # Existing repo and commit should return true
-    head_ref = lakefs.Branch(repository.id, "main", client=fs.client).head
-    assert fs.exists(f"lakefs://{repository.id}/{head_ref.id}/")
+    assert results[f"lakefs://{repository.id}/{main_head}/"]
 
     # Nonexistent branch should return false
-    assert not fs.exists(f"lakefs://{repository.id}/nonexistent/")
+    assert not results[f"lakefs://{repository.id}/nonexistent/"]
 
     # Nonexistent repo should return false
-    assert not fs.exists("lakefs://nonexistent/main/")
+    assert not results["lakefs://nonexistent/main/"]
+
+
+def test_exists_bulk(fs: LakeFSFileSystem, repository: Repository) -> None:
+    """Test `fs.exists_bulk` on a mix of existing, missing, and duplicate paths."""
+    existing = f"{repository.id}/main/README.md"
+    missing = f"{repository.id}/main/nonexistent.parquet"
+
+    results = fs.exists_bulk([existing, missing, existing])
+    assert results == {existing: True, missing: False}
+
+
+def test_exists_bulk_empty(fs: LakeFSFileSystem) -> None:
+    assert fs.exists_bulk([]) == {}
+
+
+def test_exists_bulk_invalid_max_workers(fs: LakeFSFileSystem) -> None:
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        fs.exists_bulk(["repo/main/README.md"], max_workers=0)
@@ -5,41 +5,26 @@ from lakefs.branch import Branch
 from lakefs.repository import Repository
 
 from lakefs_spec import LakeFSFileSystem
-from tests.util import RandomFileFactory, put_random_file_on_branch, with_counter
+from tests.util import APICounter, RandomFileFactory, put_random_file_on_branch
 
 
-def test_get_nonexistent_file(fs: LakeFSFileSystem, repository: Repository) -> None:
+@pytest.mark.parametrize(
+    "rpath",
+    [
+        pytest.param("{repo}/main/hello-i-no-exist1234.txt", id="nonexistent-file"),
+        pytest.param("nonexistent-repo/main/a.txt", id="nonexistent-repo"),
+        pytest.param("{repo}/nonexistentbranch/a.txt", id="nonexistent-branch"),
+    ],
+)
+def test_get_nonexistent(fs: LakeFSFileSystem, repository: Repository, rpath: str) -> None:
     """
-    Regression test against error on file closing in fs.get_file() after a
-    lakeFS API exception.
-    """
-    rpath = f"{repository.id}/main/hello-i-no-exist1234.txt"
-
-    with pytest.raises(FileNotFoundError, match=rpath):
-        fs.get(rpath, "out.txt")
-
-    assert not Path("out.txt").exists()
-
-
-def test_get_from_nonexistent_repo(fs: LakeFSFileSystem) -> None:
-    """
-    Tests that a FileNotFoundError and not a lakeFS API exception is raised
-    when attempting to access a nonexistent repository.
-    """
-    rpath = "nonexistent-repo/main/a.txt"
-
-    with pytest.raises(FileNotFoundError, match=rpath):
-        fs.get(rpath, "out.txt")
-
-    assert not Path("out.txt").exists()
-
+    Tests that a FileNotFoundError and not a lakeFS API exception is raised when
+    attempting to access a nonexistent file, repository, or branch.
 
-def test_get_from_nonexistent_branch(fs: LakeFSFileSystem, repository: Repository) -> None:
-    """
-    Tests that a FileNotFoundError and not a lakeFS API exception is raised
-    when attempting to access a nonexistent branch in an existing repository.
+    Also a regression test against error on file closing in fs.get_file() after a
+    lakeFS API exception.
     """
-    rpath = f"{repository.id}/nonexistentbranch/a.txt"
+    rpath = rpath.format(repo=repository.id)
 
     with pytest.raises(FileNotFoundError, match=rpath):
         fs.get(rpath, "out.txt")
@@ -52,16 +37,14 @@ def test_get_client_caching(
     fs: LakeFSFileSystem,
     repository: Repository,
     temp_branch: Branch,
+    counter: APICounter,
 ) -> None:
     """
     Tests that `precheck=True` prevents the download of a previously uploaded identical file.
     """
-    fs.client, counter = with_counter(fs.client)
-
     rpath = put_random_file_on_branch(
         random_file_factory, fs, repository, temp_branch, commit=False
     )
-    assert fs.exists(rpath)
 
     # try to get file, should not initiate a download due to checksum matching.
     lpath = str(random_file_factory.path / Path(rpath).name)
@@ -1,4 +1,3 @@
-import lakefs
 import pytest
 from lakefs.repository import Repository
 
@@ -42,15 +41,14 @@ def test_info_on_directory_no_trailing_slash(fs: LakeFSFileSystem, repository: R
 def test_info_on_commit(
     fs: LakeFSFileSystem,
     repository: Repository,
+    main_head: str,
 ) -> None:
     prefix = f"lakefs://{repository.id}"
 
-    head = lakefs.Branch(repository.id, "main", client=fs.client).head
-
     binfo = fs.info(f"{prefix}/main/README.md")
     branch_metadata = (binfo["checksum"], binfo["mtime"], binfo["size"])
     # fetching directly from commit should yield the same result.
-    cinfo = fs.info(f"{prefix}/{head.id}/README.md")
+    cinfo = fs.info(f"{prefix}/{main_head}/README.md")
     commit_metadata = (cinfo["checksum"], cinfo["mtime"], cinfo["size"])
 
     assert branch_metadata == commit_metadata
@@ -5,20 +5,22 @@ from lakefs.branch import Branch
 from lakefs.repository import Repository
 
 from lakefs_spec import LakeFSFileSystem
-from tests.util import RandomFileFactory, put_random_file_on_branch
 
 
-def test_lakefs_file_open_read(
-    fs: LakeFSFileSystem,
-    repository: Repository,
-    temp_branch: Branch,
-    random_file_factory: RandomFileFactory,
-) -> None:
-    rpath = put_random_file_on_branch(random_file_factory, fs, repository, temp_branch)
-    lpath = str(random_file_factory.path / Path(rpath).name)
+@pytest.fixture(scope="module")
+def uploaded_file(
+    _fs: LakeFSFileSystem, repository: Repository, module_temp_branch: Branch, random_file: Path
+) -> tuple[str, bytes]:
+    """A random file uploaded once for this module, as its remote path and contents."""
+    rpath = f"{repository.id}/{module_temp_branch.id}/{random_file.name}"
+    content = random_file.read_bytes()
+    # upload from memory through the session file system, since `fs` is function-scoped.
+    _fs.pipe_file(rpath, content)
+    return rpath, content
 
-    with open(lpath, "rb") as f:
-        orig_text = f.read()
+
+def test_lakefs_file_open_read(fs: LakeFSFileSystem, uploaded_file: tuple[str, bytes]) -> None:
+    rpath, orig_text = uploaded_file
 
     # try opening the remote file
     with fs.open(rpath) as fp:
@@ -27,30 +29,30 @@ def test_lakefs_file_open_read(
     assert text == orig_text
 
 
+@pytest.mark.parametrize(
+    "blocksize", [pytest.param(256, id="small-blocks"), pytest.param(None, id="default")]
+)
 def test_lakefs_file_open_write(
     fs: LakeFSFileSystem,
-    repository: Repository,
-    temp_branch: Branch,
-    random_file_factory: RandomFileFactory,
+    uploaded_file: tuple[str, bytes],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    blocksize: int | None,
 ) -> None:
-    rpath = put_random_file_on_branch(random_file_factory, fs, repository, temp_branch)
-    lpath = str(random_file_factory.path / Path(rpath).name)
-
-    with open(lpath, "rb") as f:
-        orig_text = f.read()
+    # rewriting the file with its own contents leaves it intact for the other tests.
+    rpath, orig_text = uploaded_file
 
     # try opening the remote file and writing to it
     with fs.open(rpath, "wb") as fp:
         fp.write(orig_text)
 
     # pulling the written file down again, using ONLY built-in open (!)
-    plpath = Path(lpath)
-    lpath = plpath.with_name(plpath.name + "_copy")
+    lpath = tmp_path / (Path(rpath).name + "_copy")
 
-    blocksize = fs.blocksize
-    fs.blocksize = 256
+    # small blocks exercise the chunked download, the default block size the common case.
+    if blocksize is not None:
+        monkeypatch.setattr(fs, "blocksize", blocksize)
     fs.get(rpath, str(lpath))
-    fs.blocksize = blocksize
 
     with open(lpath, "rb") as f:
         new_text = f.read()
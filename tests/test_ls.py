@@ -1,39 +1,40 @@
-import lakefs
+from pathlib import Path
+from typing import Any
+
 import pytest
 from lakefs.branch import Branch
 from lakefs.repository import Repository
 
 from lakefs_spec import LakeFSFileSystem
-from tests.util import RandomFileFactory, with_counter
+from tests.util import APICounter, stage_many
 
 
-@pytest.mark.parametrize("pagesize", [1, 2, 5, 10, 50])
-def test_paginated_ls(fs: LakeFSFileSystem, repository: Repository, pagesize: int) -> None:
+@pytest.mark.parametrize("pagesize", [2, 50])
+def test_paginated_ls(
+    fs: LakeFSFileSystem,
+    repository: Repository,
+    main_listing: list[dict[str, Any]],
+    pagesize: int,
+) -> None:
     """
     Check that all results of an ``ls`` call are returned independently of page size.
     """
     resource = f"{repository.id}/main/"
 
-    # default amount of 100 objects per page
-    all_results = fs.ls(resource)
-
     paged_results = fs.ls(resource, amount=pagesize, refresh=True)
-    assert paged_results == all_results
+    assert paged_results == main_listing
 
 
-def test_ls_caching(fs: LakeFSFileSystem, repository: Repository) -> None:
+def test_ls_caching(fs: LakeFSFileSystem, repository: Repository, counter: APICounter) -> None:
     """
     Check that ls calls are properly cached.
     """
-    fs.client, counter = with_counter(fs.client)
-
     testdir = "data"
     resource = f"{repository.id}/main/{testdir}/"
 
     for _ in range(2):
         fs.ls(resource)
-        assert len(fs.dircache) == 1
-        assert set(fs.dircache.keys()) == {resource.removesuffix("/")}
+        assert len(fs.dircache) == 1 and resource.removesuffix("/") in fs.dircache
 
     # assert the second `ls` call hits the cache
     assert counter.count("objects_api.list_objects") == 1
@@ -52,10 +53,10 @@ def test_ls_with_one_dir(
     fs.mkdir(f"{root}/test")
     fs.cp(f"{root}/lakes.parquet", f"{root}/test/lakes.parquet")
     fs.cp(f"{root}/lakes.parquet", f"{root}/test/lakes2.parquet")
-    fs.rm(f"{root}/README.md")
-    fs.rm(f"{root}/data/", recursive=True)
-    fs.rm(f"{root}/images/", recursive=True)
-    fs.rm(f"{root}/lakes.parquet")
+    fs.rm(
+        [f"{root}/README.md", f"{root}/data/", f"{root}/images/", f"{root}/lakes.parquet"],
+        recursive=True,
+    )
 
     # Check root
     root_resource = f"{root}/"
@@ -79,18 +80,17 @@ def test_ls_with_one_dir(
     }
 
 
-def test_ls_cache_refresh(fs: LakeFSFileSystem, repository: Repository) -> None:
+def test_ls_cache_refresh(
+    fs: LakeFSFileSystem, repository: Repository, counter: APICounter
+) -> None:
     """
     Check that ls calls bypass the dircache if requested through ``refresh=False``
     """
-    fs.client, counter = with_counter(fs.client)
-
     resource = f"{repository.id}/main/data/"
 
     for _ in range(2):
         fs.ls(resource, refresh=True)
-        assert len(fs.dircache) == 1
-        assert set(fs.dircache.keys()) == {resource.removesuffix("/")}
+        assert len(fs.dircache) == 1 and resource.removesuffix("/") in fs.dircache
 
     # assert the second `ls` call bypasses the cache
     assert counter.count("objects_api.list_objects") == 2
@@ -100,21 +100,19 @@ def test_ls_stale_cache_entry(
     fs: LakeFSFileSystem,
     repository: Repository,
     temp_branch: Branch,
-    random_file_factory: RandomFileFactory,
+    random_file: Path,
+    counter: APICounter,
 ) -> None:
-    fs.client, counter = with_counter(fs.client)
-
     resource = f"{repository.id}/main/data/"
 
     res = fs.ls(resource)
     assert counter.count("objects_api.list_objects") == 1
-    assert set(fs.dircache.keys()) == {resource.removesuffix("/")}
+    assert len(fs.dircache) == 1 and resource.removesuffix("/") in fs.dircache
 
     cache_entry = fs.dircache[resource.removesuffix("/")]
     assert len(cache_entry) == 1
     assert cache_entry[0] == res[0]
 
-    random_file = random_file_factory.make()
     lpath = str(random_file)
     rpath = f"{repository.id}/{temp_branch.id}/data/{random_file.name}"
 
@@ -132,9 +130,7 @@ def test_ls_stale_cache_entry(
     assert cache_entry[0] == res[0]
 
 
-def test_ls_no_detail(fs: LakeFSFileSystem, repository: Repository) -> None:
-    fs.client, counter = with_counter(fs.client)
-
+def test_ls_no_detail(fs: LakeFSFileSystem, repository: Repository, counter: APICounter) -> None:
     branch = "main"
     prefix = f"{repository.id}/{branch}"
     resource = f"{prefix}/data"
@@ -142,7 +138,7 @@ def test_ls_no_detail(fs: LakeFSFileSystem, repository: Repository) -> None:
     expected = [f"{resource}/lakes.source.md"]
     # first, verify the API fetch does the expected...
     assert fs.ls(resource, detail=False) == expected
-    assert set(fs.dircache.keys()) == {resource}
+    assert len(fs.dircache) == 1 and resource in fs.dircache
 
     # ...as well as the cache fetch.
     assert fs.ls(resource, detail=False) == expected
@@ -183,6 +179,16 @@ def test_ls_dircache_remove_cached(
     assert len(listing_post) == len(listing_pre) - 1
 
 
+def _dircache_violations(fs: LakeFSFileSystem) -> set[tuple[str, str]]:
+    """Collect all dircache entries that are not direct descendants of their cache key."""
+    return {
+        (cache_dir, v["name"])
+        for cache_dir, files in fs.dircache.items()
+        for v in files
+        if v["name"].rstrip("/").rpartition("/")[0] != cache_dir
+    }
+
+
 def test_ls_dircache_recursive(
     fs: LakeFSFileSystem,
     repository: Repository,
@@ -195,8 +201,8 @@ def test_ls_dircache_recursive(
     assert len(fs.dircache) > 1  # Should contain entries for all sub-folders
 
     # Dircache invariant: all files in an entry must be direct descendants of its parent
-    for cache_dir, files in fs.dircache.items():
-        assert all([fs._parent(v["name"].rstrip("/")) == cache_dir for v in files])
+    bad = _dircache_violations(fs)
+    assert not bad, bad
 
     # (2) Dircache correctness, recursive
     cached_listing_recursive = fs.ls(prefix + "/", recursive=True)
@@ -214,20 +220,20 @@ def test_ls_dircache_recursive(
     filename = "new-file.txt"
     rpath = f"{prefix}/{directory}/{filename}"
 
-    old_cache_len = len(fs.dircache.get(f"{prefix}/{directory}"))
+    old_cache_len = len(fs.dircache[f"{prefix}/{directory}"])
 
     fs.pipe(rpath, b"data")
     _ = fs.ls(prefix + "/", refresh=True, recursive=True)
 
-    cache_entry = fs.dircache.get(f"{prefix}/{directory}")
+    cache_entry = fs.dircache[f"{prefix}/{directory}"]
 
     # Added file appears in the cache entry for its parent dir
     assert len(cache_entry) == old_cache_len + 1
-    assert rpath in {f["name"] for f in cache_entry}
+    assert any(f["name"] == rpath for f in cache_entry)
 
     # Dircache invariant is maintained
-    for cache_dir, files in fs.dircache.items():
-        assert all([fs._parent(v["name"].rstrip("/")) == cache_dir for v in files])
+    bad = _dircache_violations(fs)
+    assert not bad, bad
 
 
 def test_ls_directories(
@@ -241,9 +247,14 @@ def test_ls_directories(
     fs.rm(f"{prefix}/images/", recursive=True)
     fs.rm(f"{prefix}/data/", recursive=True)
 
-    fs.pipe(f"{prefix}/a.txt", b"a")
-    fs.pipe(f"{prefix}/dir1/b.txt", b"b")
-    fs.pipe(f"{prefix}/dir1/dir2/c.txt", b"c")
+    stage_many(
+        fs,
+        {
+            f"{prefix}/a.txt": b"a",
+            f"{prefix}/dir1/b.txt": b"b",
+            f"{prefix}/dir1/dir2/c.txt": b"c",
+        },
+    )
 
     # (1) - recursive ls includes virtual directory entries for all levels except the root
     ls_recursive = fs.ls(prefix + "/", recursive=True)
@@ -261,17 +272,16 @@ def test_ls_directories(
 def test_ls_on_commit(
     fs: LakeFSFileSystem,
     repository: Repository,
+    main_head: str,
 ) -> None:
     prefix = f"lakefs://{repository.id}"
 
-    head = lakefs.Branch(repository.id, "main", client=fs.client).head
-
     from_branch = fs.ls(f"{prefix}/main/images")
     # we cannot directly compare the objects since the names will be different -
     # they are prefixed with the repository and requested reference.
     branch_metadata = [(o["checksum"], o["mtime"], o["size"]) for o in from_branch]
     # fetching directly from commit should yield the same result.
-    from_commit = fs.ls(f"{prefix}/{head.id}/images")
+    from_commit = fs.ls(f"{prefix}/{main_head}/images")
     commit_metadata = [(o["checksum"], o["mtime"], o["size"]) for o in from_commit]
 
     assert branch_metadata == commit_metadata
@@ -1,12 +1,15 @@
-import random
-import string
-
 import pytest
 from lakefs.branch import Branch
 from lakefs.repository import Repository
 
 from lakefs_spec import LakeFSFileSystem
-from tests.util import RandomFileFactory, list_branchnames, put_random_file_on_branch, with_counter
+from tests.util import (
+    APICounter,
+    RandomFileFactory,
+    branch_exists,
+    put_random_file_on_branch,
+    temp_branch_name,
+)
 
 
 def test_no_change_postcommit(
@@ -21,11 +24,12 @@ def test_no_change_postcommit(
     message = f"Add file {random_file.name}"
 
     with fs.transaction(repository, temp_branch) as tx:
-        fs.put(lpath, f"{repository.id}/{tx.branch.id}/{random_file.name}")
+        fs.put(lpath, f"{repository.id}/{tx.branch.id}/{random_file.name}", precheck=False)
         tx.commit(message=message)
 
-    commits = list(temp_branch.log(max_amount=2))
-    current_head = temp_branch.head.get_commit()
+    # amount=2 makes the server return just the two commits we inspect, not a full page.
+    commits = list(temp_branch.log(max_amount=2, amount=2))
+    current_head = commits[0]
     assert commits[0].message.startswith("Merge")
     assert commits[1].message == message
 
@@ -35,7 +39,7 @@ def test_no_change_postcommit(
         tx.commit(message=f"Add file {random_file.name}")
 
     # check that no other commit has happened.
-    assert temp_branch.head.get_commit() == current_head
+    assert temp_branch.head.id == current_head.id
 
 
 def test_implicit_branch_creation(
@@ -43,16 +47,17 @@ def test_implicit_branch_creation(
     fs: LakeFSFileSystem,
     repository: Repository,
     temp_branch: Branch,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    non_existing_branch = "non-existing-" + "".join(random.choices(string.digits, k=8))
+    non_existing_branch = temp_branch_name("non-existing-")
     put_random_file_on_branch(random_file_factory, fs, repository, non_existing_branch)
 
-    assert non_existing_branch in list_branchnames(repository)
+    assert branch_exists(repository, non_existing_branch)
     # branch has been created at this point
     repository.branch(non_existing_branch).delete()
 
-    fs.create_branch_ok = False
-    another_non_existing_branch = "non-existing-" + "".join(random.choices(string.digits, k=8))
+    monkeypatch.setattr(fs, "create_branch_ok", False)
+    another_non_existing_branch = temp_branch_name("non-existing-")
     with pytest.raises(FileNotFoundError):
         put_random_file_on_branch(random_file_factory, fs, repository, another_non_existing_branch)
 
@@ -62,11 +67,10 @@ def test_put_client_caching(
     fs: LakeFSFileSystem,
     repository: Repository,
     temp_branch: Branch,
+    counter: APICounter,
 ) -> None:
     """
     Tests that ``precheck=True`` prevents a second upload of an identical file by matching checksums.
     """
-    fs.client, counter = with_counter(fs.client)
-
     rpath = put_random_file_on_branch(random_file_factory, fs, repository, temp_branch)
     assert fs.exists(rpath)
@@ -1,11 +1,13 @@
-import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
 
 import pytest
 from lakefs.branch import Branch
 from lakefs.repository import Repository
 
 from lakefs_spec import LakeFSFileSystem
-from tests.util import RandomFileFactory
+from tests.util import RandomFileFactory, stage_many, temp_branch_name
 
 
 def test_rm(
@@ -31,7 +33,7 @@ def test_rm_with_transaction(
         fs.rm(f"{repository.id}/{tx.branch.id}/README.md")
         tx.commit(message=message)
 
-    commits = list(temp_branch.log(max_amount=2))
+    commits = list(temp_branch.log(max_amount=2, amount=2))
     assert not fs.exists(path)
     assert commits[-1].message == message
     assert commits[0].message.startswith("Merge")
@@ -45,8 +47,7 @@ def test_rm_recursive(
     """Validate that recursive ``rm`` removes subdirectories as well."""
     prefix = f"lakefs://{repository.id}/{temp_branch.id}"
 
-    fs.pipe(f"{prefix}/dir1/b.txt", b"b")
-    fs.pipe(f"{prefix}/dir1/dir2/c.txt", b"c")
+    stage_many(fs, {f"{prefix}/dir1/b.txt": b"b", f"{prefix}/dir1/dir2/c.txt": b"c"})
 
     fs.rm(f"{prefix}/dir1", recursive=False)
     assert fs.exists(f"{prefix}/dir1/dir2/c.txt")
@@ -64,16 +65,95 @@ def test_rm_recursive_with_maxdepth(
     """
     prefix = f"lakefs://{repository.id}/{temp_branch.id}"
 
-    fs.pipe(f"{prefix}/dir1/b.txt", b"b")
-    fs.pipe(f"{prefix}/dir1/dir2/c.txt", b"c")
+    stage_many(fs, {f"{prefix}/dir1/b.txt": b"b", f"{prefix}/dir1/dir2/c.txt": b"c"})
 
     fs.rm(f"{prefix}/dir1", recursive=True, maxdepth=1)
     # maxdepth is 1-indexed, level 1 being the directory to be removed.
     assert fs.exists(f"{prefix}/dir1/dir2/c.txt")
 
 
-@pytest.mark.asyncio
-async def test_rm_with_1k_objects_or_more(
+def test_rm_multiple_branches(
+    fs: LakeFSFileSystem,
+    repository: Repository,
+    temp_branch: Branch,
+    temporary_branch_context: Any,
+) -> None:
+    """Check that a single ``rm`` call removes paths on several branches."""
+    with temporary_branch_context(temp_branch_name()) as other_branch:
+        paths = [
+            f"{repository.id}/{temp_branch.id}/dir1/b.txt",
+            f"{repository.id}/{other_branch.id}/dir1/b.txt",
+        ]
+        stage_many(fs, dict.fromkeys(paths, b"b"))
+
+        fs.rm(
+            [f"{repository.id}/{temp_branch.id}/dir1", f"{repository.id}/{other_branch.id}/dir1"],
+            recursive=True,
+        )
+        assert not any(fs.exists_bulk(paths).values())
+
+
+def test_rm_multiple_with_maxdepth(
+    fs: LakeFSFileSystem,
+    repository: Repository,
+    temp_branch: Branch,
+) -> None:
+    """Check that ``maxdepth`` applies to all paths of a multi-path ``rm``."""
+    prefix = f"lakefs://{repository.id}/{temp_branch.id}"
+
+    stage_many(
+        fs,
+        {
+            f"{prefix}/dir1/b.txt": b"b",
+            f"{prefix}/dir1/dir2/c.txt": b"c",
+            f"{prefix}/dir3/d.txt": b"d",
+            f"{prefix}/dir3/dir4/e.txt": b"e",
+        },
+    )
+
+    fs.rm([f"{prefix}/dir1", f"{prefix}/dir3"], recursive=True, maxdepth=1)
+    exists = fs.exists_bulk(
+        [
+            f"{prefix}/dir1/b.txt",
+            f"{prefix}/dir1/dir2/c.txt",
+            f"{prefix}/dir3/d.txt",
+            f"{prefix}/dir3/dir4/e.txt",
+        ]
+    )
+    assert exists == {
+        f"{prefix}/dir1/b.txt": False,
+        f"{prefix}/dir1/dir2/c.txt": True,
+        f"{prefix}/dir3/d.txt": False,
+        f"{prefix}/dir3/dir4/e.txt": True,
+    }
+
+
+def test_rm_overlapping_paths(
+    fs: LakeFSFileSystem,
+    repository: Repository,
+    temp_branch: Branch,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check that objects matched by overlapping paths are deleted only once."""
+    prefix = f"lakefs://{repository.id}/{temp_branch.id}"
+    stage_many(fs, {f"{prefix}/dir1/a.txt": b"a", f"{prefix}/dir1/b.txt": b"b"})
+
+    deleted: list[str] = []
+    delete_objects = Branch.delete_objects
+
+    def recording_delete_objects(self, object_paths):
+        object_paths = list(object_paths)
+        deleted.extend(object_paths)
+        return delete_objects(self, object_paths)
+
+    monkeypatch.setattr(Branch, "delete_objects", recording_delete_objects)
+
+    fs.rm([f"{prefix}/dir1/", f"{prefix}/dir1/a.txt"], recursive=True)
+    assert sorted(deleted) == ["dir1/a.txt", "dir1/b.txt"]
+    assert not fs.exists(f"{prefix}/dir1/a.txt")
+
+
+def test_rm_with_1k_objects_or_more(
     fs: LakeFSFileSystem,
     repository: Repository,
     temp_branch: Branch,
@@ -85,16 +165,12 @@ async def test_rm_with_1k_objects_or_more(
     testdir = f"{repository.id}/{temp_branch.id}/subfolder"
 
     # Create and put 1001 objects into the above lakeFS directory (to exceed the 1k API batch limit)
-    # Doing this async since we are I/O bound and get a significant speedup.
-    # Unfortunately, we cannot use a TaskGroup, since it was only introduced in Python 3.11.
-    tasks = []
-    for i in range(1002):
-        f = random_file_factory.make()
-        lpath = str(f)
-        rpath = testdir + f"/test_{i}.txt"
-        task = asyncio.create_task(asyncio.to_thread(fs.put_file, lpath, rpath))
-        tasks.append(task)
-    await asyncio.gather(*tasks)
+    # Uploading from a thread pool since we are I/O bound and get a significant speedup.
+    lpaths = [str(random_file_factory.make()) for _ in range(1002)]
+    rpaths = [f"{testdir}/test_{i}.txt" for i in range(1002)]
+    with ThreadPoolExecutor(max_workers=64) as executor:
+        # consume the iterator to re-raise upload errors in the test.
+        list(executor.map(partial(fs.put_file, precheck=False), lpaths, rpaths))
 
     assert len(fs.ls(testdir, detail=False)) > 1000
 
@@ -1,8 +1,11 @@
+import hashlib
+import os
 import re
+from pathlib import Path
 
 import pytest
 
-from lakefs_spec.util import _batched, _uri_parts
+from lakefs_spec.util import _batched, _uri_parts, md5_checksum
 
 
 def test_batched_empty_iterable():
@@ -69,3 +72,13 @@ class TestLakeFSUriPartRegexes:
             assert result is not None
         else:
             assert result is None
+
+
+@pytest.mark.parametrize("size", [0, 1000, 2**12])
+@pytest.mark.parametrize("blocksize", [2**5, 2**8, 2**12, 2**22])
+def test_md5_checksum(tmp_path: Path, size: int, blocksize: int) -> None:
+    """The checksum does not depend on the block size, also for partial last blocks."""
+    content = os.urandom(size)
+    lpath = tmp_path / "file.bin"
+    lpath.write_bytes(content)
+    assert md5_checksum(lpath, blocksize) == hashlib.md5(content).hexdigest()
@@ -1,20 +1,27 @@
 import collections
-import random
-import string
+import contextlib
+import functools
+import os
 import uuid
-from inspect import ismethod
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Any
 
 from lakefs.branch import Branch
 from lakefs.client import Client
+from lakefs.exceptions import NotFoundException
 from lakefs.repository import Repository
 
 from lakefs_spec import LakeFSFileSystem
 
 
 class APICounter:
+    __slots__ = ("_counts",)
+
     def __init__(self):
-        self._counts: dict[str, int] = collections.defaultdict(int)
+        self._counts: collections.Counter[str] = collections.Counter()
 
     def clear(self):
         self._counts.clear()
@@ -34,33 +41,56 @@ class APICounter:
         self._counts[name] += 1
 
 
-def with_counter(client: Client) -> tuple[Client, APICounter]:
-    """Instruments a lakeFS API client with an API counter."""
-    counter = APICounter()
+# the counter that API calls are currently counted towards, if any.
+_active_counter: ContextVar[APICounter | None] = ContextVar("_active_counter", default=None)
+
+
+class _CountingAPI:
+    """Proxy around a lakeFS SDK API object that counts calls to its public endpoints."""
+
+    def __init__(self, api: Any, api_name: str):
+        self._api = api
+        self._api_name = api_name
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if name.startswith("_") or name.endswith("with_http_info") or not callable(attr):
+            return attr
 
-    def patch(fn, name):
-        """Patches an API instance method ``fn`` on an API ``apiname``."""
+        key = f"{self._api_name}.{name}"
 
+        @functools.wraps(attr)
         def wrapped_fn(*args, **kwargs):
-            counter.increment(name)
-            return fn(*args, **kwargs)
+            if (counter := _active_counter.get()) is not None:
+                counter.increment(key)
+            return attr(*args, **kwargs)
 
+        # cache the wrapper on the proxy, so that later accesses skip `__getattr__` entirely.
+        setattr(self, name, wrapped_fn)
         return wrapped_fn
 
-    for api_name, api in client.sdk_client.__dict__.items():
-        if api_name == "_api":
-            continue
 
-        for ep_name in filter(
-            lambda op: not op.startswith("_")
-            and not op.endswith("with_http_info")
-            and ismethod(getattr(api, op)),
-            dir(api),
-        ):
-            endpoint = getattr(api, ep_name)
-            setattr(api, ep_name, patch(endpoint, f"{api_name}.{ep_name}"))
+@contextlib.contextmanager
+def with_counter(client: Client) -> Iterator[APICounter]:
+    """
+    Counts the lakeFS API calls made through ``client`` while the context is active.
 
-    return client, counter
+    The active counter is held in a context variable, which threads started by a
+    ``ThreadPoolExecutor`` do not inherit. Calls made from worker threads, e.g. through
+    ``stage_many`` or ``LakeFSFileSystem.exists_bulk``, are therefore not counted.
+    """
+    # swap each API object for a counting proxy (once) instead of patching every endpoint.
+    sdk_client = client.sdk_client
+    for api_name, api in list(vars(sdk_client).items()):
+        if api_name != "_api" and not isinstance(api, _CountingAPI):
+            setattr(sdk_client, api_name, _CountingAPI(api, api_name))
+
+    counter = APICounter()
+    token = _active_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _active_counter.reset(token)
 
 
 class RandomFileFactory:
@@ -75,14 +105,12 @@ class RandomFileFactory:
 
     def make(self, fname: str | None = None, size: int = 2**10) -> Path:
         """
-        Generate a random file named ``fname`` with a random string of size
-        ``size`` (in bytes) as content.
+        Generate a random file named ``fname`` with ``size`` random bytes as content.
         """
         if fname is None:
             fname = "test-" + str(uuid.uuid4()) + ".txt"
         random_file = self.path / fname
-        random_str = "".join(random.choices(string.ascii_letters + string.digits, k=size))
-        random_file.write_text(random_str, encoding="utf-8")
+        random_file.write_bytes(os.urandom(size))
         return random_file
 
 
@@ -106,5 +134,27 @@ def put_random_file_on_branch(
     return rpath
 
 
-def list_branchnames(repository: Repository) -> list[str]:
-    return [branch.id for branch in repository.branches()]
+def stage_many(fs: LakeFSFileSystem, mapping: dict[str, bytes]) -> None:
+    """Upload several small objects concurrently, one ``pipe_file`` call per thread."""
+    if len(mapping) <= 1:
+        # not worth a thread pool.
+        for path, data in mapping.items():
+            fs.pipe_file(path, data)
+        return
+    with ThreadPoolExecutor(max_workers=min(len(mapping), 8)) as executor:
+        # consume the iterator to re-raise upload errors in the calling thread.
+        list(executor.map(fs.pipe_file, mapping.keys(), mapping.values()))
+
+
+def temp_branch_name(prefix: str = "test-") -> str:
+    # uuid-based names cannot collide with leftover branches from earlier (aborted) runs.
+    return prefix + uuid.uuid4().hex[:12]
+
+
+def branch_exists(repository: Repository, name: str) -> bool:
+    """Check for the existence of a branch with a single lookup instead of listing all branches."""
+    try:
+        _ = repository.branch(name).head
+    except NotFoundException:
+        return False
+    return True